@@ -1,56 +1,66 @@
 import os
 import sys
 from pathlib import Path
-from struct import pack, unpack
+from struct import Struct
+
+_U32 = Struct("<I")
+_S32 = Struct("<i")
+_U16 = Struct("<H")
+_S16 = Struct("<h")
+_U8 = Struct("<B")
+_S8 = Struct("<b")
+_BOOL = Struct("<?")
+_F32 = Struct("<f")
+
+# Resources are bundled next to the executable when frozen by PyInstaller
+if hasattr(sys, "_MEIPASS"):
+    _BASE_PATH = Path(sys._MEIPASS)
+else:
+    _BASE_PATH = Path(os.path.dirname(__file__))
 
 
 def resource_path(relative_path: str) -> Path:
-    current_path = Path(".")
-    if hasattr(sys, "_MEIPASS"):
-        current_path = Path(sys._MEIPASS)
-    else:
-        current_path = Path(os.path.dirname(__file__))
-    return current_path.joinpath(relative_path)
+    return _BASE_PATH.joinpath(relative_path)
 
 
 def replace_byte_array(fdata: bytes, position: int, value: bytes):
     fdata = bytearray(fdata)
-    for i in range(0, len(value)):
-        fdata[position + i] = value[i]
-    fdata = bytes(fdata)
-    return fdata
+    # Bytes past the end are dropped, so the data never grows
+    end = min(position + len(value), len(fdata))
+    fdata[position:end] = value[: end - position]
+    return bytes(fdata)
 
 
 def read_uint(fdata: bytes, position: int = 0x0) -> int:
-    return unpack("I", read_byte_array(fdata, position, 4))[0]
+    return _U32.unpack_from(fdata, position)[0]
 
 
 def read_ushort(fdata: bytes, position: int = 0x0) -> int:
-    return unpack("H", read_byte_array(fdata, position, 2))[0]
+    return _U16.unpack_from(fdata, position)[0]
 
 
 def read_uchar(fdata: bytes, position: int = 0x0) -> int:
-    return unpack("B", read_byte_array(fdata, position, 1))[0]
+    return _U8.unpack_from(fdata, position)[0]
 
 
 def read_int(fdata: bytes, position: int = 0x0) -> int:
-    return unpack("i", read_byte_array(fdata, position, 4))[0]
+    return _S32.unpack_from(fdata, position)[0]
 
 
 def read_short(fdata: bytes, position: int = 0x0) -> int:
-    return unpack("h", read_byte_array(fdata, position, 2))[0]
+    return _S16.unpack_from(fdata, position)[0]
 
 
 def read_char(fdata: bytes, position: int = 0x0) -> int:
-    return unpack("b", read_byte_array(fdata, position, 1))[0]
+    return _S8.unpack_from(fdata, position)[0]
 
 
 def read_bool(fdata: bytes, position: int = 0x0) -> int:
-    return unpack("?", read_byte_array(fdata, position, 1))[0]
+    return _BOOL.unpack_from(fdata, position)[0]
 
 
 def read_float(fdata: bytes, position: int = 0x0) -> int:
-    return unpack("f", read_byte_array(fdata, position, 4))[0]
+    return _F32.unpack_from(fdata, position)[0]
 
 
 # def read_str(fdata: bytes, position: int = 0x0) -> str:
@@ -63,17 +73,15 @@ def read_float(fdata: bytes, position: int = 0x0) -> int:
 
 
 def read_str(fdata: bytes, position: int = 0x0) -> str:
-    string_bytes = bytearray()
-    offset = 0x0
-    while (last_byte := read_uchar(fdata, position + offset)) != 0x00 and offset < len(
-        fdata
-    ) - 1:
-        string_bytes.append(last_byte)
-        offset += 1
+    string_bytes = bytes(fdata[position:])
+    end = string_bytes.find(b"\x00")
+    if end == -1:
+        end = len(string_bytes) - 1
+    string_bytes = string_bytes[:end]
     try:
-        string = unpack(f"{len(string_bytes)}s", string_bytes)[0].decode("utf-8")
+        string = string_bytes.decode("utf-8")
     except UnicodeDecodeError as _:
-        string = unpack(f"{len(string_bytes)}s", string_bytes)[0].decode("shift_jis")
+        string = string_bytes.decode("shift_jis")
 
     return string
 
@@ -84,16 +92,32 @@ def read_str_short(fdata: bytes, position: int = 0x0) -> str:
     while (
         last_bytes := read_ushort(fdata, position + offset)
     ) != 0x00 and offset < len(fdata) - 1:
-        string_bytes += pack("H", last_bytes)
+        string_bytes += fdata[position + offset : position + offset + 2]
         offset += 2
     try:
-        string = unpack(f"{len(string_bytes)}s", string_bytes)[0].decode("utf-16")
+        string = string_bytes.decode("utf-16")
     except UnicodeDecodeError as _:
-        string = unpack(f"{len(string_bytes)}s", string_bytes)[0].decode("shift_jis")
+        string = string_bytes.decode("shift_jis")
 
     return string
 
 
+# Reader for each field type in the settings file
+TYPE_READERS = {
+    "uint": read_uint,
+    "rgba": read_uint,
+    "int": read_int,
+    "short": read_short,
+    "ushort": read_ushort,
+    "char": read_char,
+    "uchar": read_uchar,
+    "bool": read_bool,
+    "float": read_float,
+    "str": read_str,
+    "string": read_str,
+}
+
+
 def string_to_bytearray(string: str, required_size: int = None):
     try:
         ba = string.encode("shift_jis")
@@ -17,9 +17,15 @@ class QCheckBoxField(QCheckBox):
     def set_field(self, field: Field):
         if field.settings.type == "bool":
             self.field = field
+            # Showing the current value is not an edit
+            self.blockSignals(True)
             self.setChecked(field.value)
+            self.blockSignals(False)
             self.setToolTip(field.settings.description)
 
+    def clear_field(self):
+        self.field = None
+
     def update_field_value(self, value: bool):
         try:
             self.field.set_value(value)
@@ -34,6 +34,12 @@ class QColorPickerField(QLineEdit):
             self.color = field.value
             self.update_aspect()
 
+    def clear_field(self):
+        self.field = None
+        self.color = None
+        self.setStyleSheet("")
+        self.setText("No color selected")
+
     def update_field_value(self, value: bool):
         try:
             self.field.set_value(value)
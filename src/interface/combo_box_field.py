@@ -34,6 +34,14 @@ class QComboBoxField(QComboBox):
                 self.set_values_short()
             self.setDisabled(False)
 
+    def clear_field(self):
+        if self.field is not None and not self.is_long:
+            self.currentTextChanged.disconnect(self.update_field_value)
+        self.field = None
+        self.is_long = False
+        self.clear()
+        self.setDisabled(True)
+
     def set_values_short(self):
         self.addItems(self.field.settings.enum.get_values())
         if self.field.settings.enum.null_value is not None:
@@ -22,6 +22,13 @@ class QLineEditField(QLineEdit):
         self.original_value = field.value
         self.textChanged.connect(self.update_field_value)
 
+    def clear_field(self):
+        if self.field is not None:
+            self.textChanged.disconnect(self.update_field_value)
+        self.field = None
+        self.setValidator(None)
+        self.setMaxLength(32767)
+
     def set_validator(self, type: str, size: int):
         validator = QtGui.QIntValidator()
         if type == "uint":
@@ -1,63 +1,125 @@
-from struct import pack
+from struct import Struct, calcsize, pack
 
 from const import PARAM_HEADER
-from data import (
-    read_bool,
-    read_byte_array,
-    read_char,
-    read_float,
-    read_int,
-    read_short,
-    read_str,
-    read_uchar,
-    read_uint,
-    read_ushort,
-    replace_byte_array,
-    string_to_bytearray,
-)
+from data import read_byte_array, string_to_bytearray
 from settings.settings import Settings, SettingsFieldEntry
 
+# ptr, unk1, sections, unk2, id, unk3
+HEADER_STRUCT = Struct("<IIIIII")
+SECTION_INFO_STRUCT = Struct("<II")
+
+STRUCT_CODES = {
+    "uint": "I",
+    "rgba": "I",
+    "int": "i",
+    "ushort": "H",
+    "short": "h",
+    "uchar": "B",
+    "char": "b",
+    "bool": "?",
+    "float": "f",
+}
+
+
+def get_entry_struct(settings: list):
+    """
+    Builds a single struct that unpacks every field of an entry at once
+    Args:
+        settings (list): Field settings of the section
+    Returns:
+        tuple: Struct and the settings index of each unpacked value, or None
+        if a field has no address or size, the fields overlap, use an unknown
+        type or have a size that does not match their type. String fields are
+        skipped as padding and left for Field to decode when needed
+    """
+    if not settings:
+        return None
+
+    for setting in settings:
+        if setting.address is None or setting.size is None:
+            return None
+
+    format = "<"
+    order = []
+    position = 0x0
+
+    for index, setting in sorted(
+        enumerate(settings), key=lambda item: item[1].address
+    ):
+        if setting.address < position:
+            return None
+
+        is_string = setting.type == "str" or setting.type == "string"
+        if is_string:
+            code = f"{setting.size}x"
+        elif setting.type in STRUCT_CODES:
+            code = STRUCT_CODES[setting.type]
+        else:
+            return None
+
+        if calcsize("<" + code) != setting.size:
+            return None
+
+        if setting.address > position:
+            format += f"{setting.address - position}x"
+        format += code
+        if not is_string:
+            order.append(index)
+        position = setting.address + setting.size
+
+    return Struct(format), order
+
 
 class Field:
     """
     Field
     """
 
-    def __init__(self, id: int, settings: SettingsFieldEntry, data: bytes):
+    # Fields are created for every entry, so skip the per-instance dict
+    __slots__ = ("id", "settings", "entry_data", "_raw_data", "_value")
+
+    def __init__(
+        self, id: int, settings: SettingsFieldEntry, entry_data: bytes, value=None
+    ):
         self.id = id
         self.settings = settings
-        self.raw_data = data
-        self.initial_raw_data = data
-        self.value = None
-        self.process_value()
+        self.entry_data = entry_data
+        self._raw_data = None
+        self._value = value
+
+    @property
+    def initial_raw_data(self):
+        # Sliced from the entry data on demand instead of stored per field
+        address = self.settings.address
+        return self.entry_data[address : address + self.settings.size]
+
+    @property
+    def raw_data(self):
+        if self._raw_data is not None:
+            return self._raw_data
+        return self.initial_raw_data
+
+    @property
+    def value(self):
+        # Decoded on first access, most fields are never displayed
+        if self._value is None:
+            self.process_value()
+        return self._value
+
+    @value.setter
+    def value(self, new_value):
+        self._value = new_value
 
     def update_raw_data(self, data: bytes):
-        self.raw_data = data
-        self.process_value()
+        self._raw_data = data
+        self._value = None
 
     def process_value(self):
-        data = self.raw_data
-        type = self.settings.type
-        if type == "uint" or type == "rgba":
-            self.value = read_uint(data)
-        elif type == "int":
-            self.value = read_int(data)
-        elif type == "short":
-            self.value = read_short(data)
-        elif type == "ushort":
-            self.value = read_ushort(data)
-        elif type == "char":
-            self.value = read_char(data)
-        elif type == "uchar":
-            self.value = read_uchar(data)
-        elif type == "bool":
-            self.value = read_bool(data)
-        elif type == "float":
-            self.value = read_float(data)
-        elif type == "str" or type == "string":
-            self.value = read_str(data)
+        reader = self.settings.reader
+        if reader is not None:
+            self._value = reader(self.raw_data)
         else:
-            self.value = None
+            self._value = None
 
     def set_value(self, new_value):
         self.value = new_value
@@ -114,32 +176,67 @@ class Entry:
     Entry
     """
 
-    def __init__(self, id: int, settings: list, data: bytes):
+    __slots__ = (
+        "id",
+        "settings",
+        "entry_struct",
+        "raw_data",
+        "initial_raw_data",
+        "fields",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        settings: list,
+        data: bytes,
+        entry_struct=None,
+        unpacked: tuple = None,
+    ):
         self.id = id
         self.settings = settings
+        self.entry_struct = entry_struct
         self.raw_data = data
         self.initial_raw_data = data
 
         self.fields = []
-        self.process_data()
+        self.process_data(unpacked)
 
-    def process_data(self):
+    def process_data(self, unpacked: tuple = None):
         self.fields.clear()
         if self.settings == None:
             return
-        for setting in self.settings:
-            field_data = read_byte_array(self.raw_data, setting.address, setting.size)
-            self.fields.append(Field(self.settings.index(setting), setting, field_data))
+        data = memoryview(self.raw_data)
+
+        # Unpack all values in one call when the layout allows it
+        values = [None] * len(self.settings)
+        if self.entry_struct is not None:
+            entry_struct, order = self.entry_struct
+            if unpacked is None and len(data) >= entry_struct.size:
+                unpacked = entry_struct.unpack_from(data)
+            if unpacked is not None:
+                for index, value in zip(order, unpacked):
+                    values[index] = value
+
+        for index, setting in enumerate(self.settings):
+            self.fields.append(Field(index, setting, data, values[index]))
 
     def to_bytes(self):
-        raw_data = self.raw_data
+        raw_data = bytearray(self.raw_data)
 
         for field in self.fields:
-            raw_data = replace_byte_array(
-                raw_data, field.settings.address, field.to_bytes()
+            address = field.settings.address
+            field_data = field.to_bytes()
+
+            # Clip to the field and entry size, so the entry never grows
+            end = min(
+                address + len(field_data),
+                address + field.settings.size,
+                len(raw_data),
             )
+            raw_data[address:end] = field_data[: end - address]
 
-        return raw_data
+        return bytes(raw_data)
 
     def get_name(self) -> str:
         name = []
@@ -191,6 +288,7 @@ class Section:
         self.settings = settings
         self.entry_size = entry_size
         self.entry_amount = entry_amount
+        self.entry_struct = get_entry_struct(settings)
 
         # Entry list
         self.raw_data = data
@@ -198,17 +296,51 @@ class Section:
         self.process_data(data)
 
     def process_data(self, data):
+        # Entries are views into the section data, not copies
+        data = memoryview(data)
+        unpacked = self.decode_entries(data)
+        offset = 0
         for index in range(self.entry_amount):
-            raw_data = read_byte_array(data, index * self.entry_size, self.entry_size)
-            self.entry_list.append(Entry(index, self.settings, raw_data))
+            raw_data = data[offset : offset + self.entry_size]
+            self.entry_list.append(
+                Entry(
+                    index,
+                    self.settings,
+                    raw_data,
+                    self.entry_struct,
+                    unpacked[index] if unpacked else None,
+                )
+            )
+            offset += self.entry_size
 
-    def to_bytes(self):
-        raw_data = b""
+    def decode_entries(self, data: memoryview) -> list:
+        """
+        Unpacks the fields of every entry in the section in one pass
+        Args:
+            data (memoryview): Section data
+        Returns:
+            list: Unpacked values of each entry, or None if the section can not
+            be decoded in bulk
+        """
+        if self.entry_struct is None or self.entry_amount == 0:
+            return None
 
-        for entry in self.entry_list:
-            raw_data += entry.to_bytes()
+        entry_struct, _ = self.entry_struct
+        if entry_struct.size > self.entry_size:
+            return None
 
-        return raw_data
+        section_size = self.entry_size * self.entry_amount
+        if len(data) < section_size:
+            return None
+
+        # Pad the entry struct so that it spans exactly one entry
+        padding = self.entry_size - entry_struct.size
+        section_struct = Struct(entry_struct.format + f"{padding}x")
+
+        return list(section_struct.iter_unpack(data[:section_size]))
+
+    def to_bytes(self):
+        return b"".join([entry.to_bytes() for entry in self.entry_list])
 
     def remove_entry(self, entry: Entry):
         self.entry_list.remove(entry)
@@ -217,7 +349,9 @@ class Section:
     def add_entry(self, data: bytes = None):
         if data == None:
             data = b"\x00" * self.entry_size
-        self.entry_list.append(Entry(len(self.entry_list), self.settings, data))
+        self.entry_list.append(
+            Entry(len(self.entry_list), self.settings, data, self.entry_struct)
+        )
         self.update_entry_amount()
 
     def update_entry_amount(self):
@@ -300,12 +434,14 @@ class Param:
             data (bytes): File data
         """
 
-        self.ptr = read_uint(data, 0x8)
-        self.unk1 = read_uint(data, 0xC)
-        self.sections = read_uint(data, 0x10)
-        self.unk2 = read_uint(data, 0x14)
-        self.id = read_uint(data, 0x18)
-        self.unk3 = read_uint(data, 0x1C)
+        (
+            self.ptr,
+            self.unk1,
+            self.sections,
+            self.unk2,
+            self.id,
+            self.unk3,
+        ) = HEADER_STRUCT.unpack_from(data, 0x8)
 
     def process_data(self, data: bytes):
         """
@@ -315,15 +451,17 @@ class Param:
         """
         self.raw_data = data
 
-        section_index = 0x20
+        # Sections keep views into the file data instead of copies
+        data = memoryview(data)
+        section_info = data[0x20 : 0x20 + SECTION_INFO_STRUCT.size * self.sections]
         data_index = self.ptr
 
-        for section in range(self.sections):
+        for section, (section_entries, section_size) in enumerate(
+            SECTION_INFO_STRUCT.iter_unpack(section_info)
+        ):
             section_settings = self.settings.get_entries_in_param(self.id, section)
 
-            section_entries = read_uint(data, section_index)
-            section_size = read_uint(data, section_index + 0x4)
-            raw_data = read_byte_array(data, data_index, section_entries * section_size)
+            raw_data = data[data_index : data_index + section_entries * section_size]
 
             self.section_list.append(
                 Section(
@@ -331,7 +469,6 @@ class Param:
                 )
             )
 
-            section_index += 0x8
             data_index += len(raw_data)
 
     def get_section_entry_amount(self, section_index: int = 0) -> int:
@@ -378,40 +515,46 @@ class Param:
         return False
 
     def to_bytes(self) -> bytes:
+        return b"".join(self.iter_bytes())
+
+    def iter_bytes(self):
+        """
+        Yields the file contents chunk by chunk, the header first and then
+        the content of each section
+        """
+        # Section info follows the 0x20 byte header
+        header_size = 0x20 + SECTION_INFO_STRUCT.size * len(self.section_list)
+
+        # Base pointer is the starting position of data, zero filled up to it
+        ptr = header_size + header_size % 0x10
+        header = bytearray(ptr)
+
         # 0x0 - 0x4
-        file = PARAM_HEADER
+        header[0x0 : len(PARAM_HEADER)] = PARAM_HEADER
 
-        # 0x8 - 0xC - 0x10
-        file += pack(
-            "III",
-            self.ptr,
+        # 0x8 - 0xC - 0x10 - 0x14 - 0x18 - 0x1C
+        HEADER_STRUCT.pack_into(
+            header,
+            0x8,
+            ptr,
             self.unk1,
             self.sections,
-        )
-
-        # 0x14 - 0x18 - 0x1C
-        file += pack(
-            "III",
             self.unk2,
             self.id,
             self.unk3,
         )
 
-        section_contents = b""
-
-        # Write section info and append content
-        for section in self.section_list:
-            file += pack("II", section.entry_amount, section.entry_size)
-            section_contents += section.to_bytes()
-
-        # Fill with zeroes
-        if len(file) % 0x10 != 0:
-            file += b"\x00" * (len(file) % 0x10)
+        # Write section info
+        for index, section in enumerate(self.section_list):
+            SECTION_INFO_STRUCT.pack_into(
+                header,
+                0x20 + SECTION_INFO_STRUCT.size * index,
+                section.entry_amount,
+                section.entry_size,
+            )
 
-        # Overwrite base pointer with starting position of data
-        file = replace_byte_array(file, 0x8, pack("I", len(file)))
+        yield bytes(header)
 
         # Append section content
-        file += section_contents
-
-        return file
+        for section in self.section_list:
+            yield section.to_bytes()
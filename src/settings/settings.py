@@ -1,4 +1,4 @@
-from data import parse_bool, parse_int, read_int, read_str_short
+from data import TYPE_READERS, parse_bool, parse_int, read_int, read_str_short
 
 
 class SettingsEnumEntry:
@@ -46,6 +46,7 @@ class SettingsFieldEntry:
         self.name = name
         self.description = description
         self.type = type
+        self.reader = TYPE_READERS.get(type)
         self.shown = shown
         self.enum = enum
 
@@ -20,6 +20,14 @@ data = open(resource_path("res/settings.txt")).readlines()
 settings.load_enums_from_data(data)
 settings.load_fields_from_data(data)
 
+
+def get_field_values(param: Param) -> list:
+    return [
+        [[field.value for field in entry.fields] for entry in section.entry_list]
+        for section in param.section_list
+    ]
+
+
 # Create param
 param = Param(None, settings)
 directory = "res/base_params/"
@@ -37,6 +45,55 @@ for filename in os.listdir(directory):
         print(f"Loading param file: {filename}")
         param.load_from_data(data)
         print(f"Converting param file to bytes: {filename}")
-        param.to_bytes()
+        new_data = param.to_bytes()
+        print(f"Checking that {filename} keeps its values after saving")
+        new_param = Param(new_data, settings)
+        assert get_field_values(new_param) == get_field_values(param)
+        assert new_param.to_bytes() == new_data
+
+with open(resource_path("res/base_params/classparam"), "rb") as file:
+    data = file.read()
+
+print("Checking that an edited field is saved")
+param = Param(data, settings)
+entry = param.get_section_entry(0, 0)
+field = [field for field in entry.fields if field.settings.type == "int"][0]
+other_values = [other.value for other in entry.fields if other is not field]
+assert not param.is_changed()
+field.set_value(field.value + 1)
+assert param.is_changed()
+new_entry = Param(param.to_bytes(), settings).get_section_entry(0, 0)
+new_field = new_entry.fields[field.id]
+assert new_field.value == field.value
+assert [other.value for other in new_entry.fields if other.id != field.id] == (
+    other_values
+)
+
+print("Checking that replacing raw entry data updates its fields")
+param = Param(data, settings)
+entry = param.get_section_entry(0, 0)
+other_entry = param.get_section_entry(0, 1)
+assert not param.is_changed()
+entry.update_raw_data(other_entry.to_bytes())
+assert [field.value for field in entry.fields] == [
+    field.value for field in other_entry.fields
+]
+assert entry.to_bytes() == other_entry.to_bytes()
+assert param.is_changed()
+
+with open(resource_path("res/base_params/weaponparam"), "rb") as file:
+    data = file.read()
+
+print("Checking that an oversized string does not grow its entry")
+param = Param(data, settings)
+section = param.get_section(1)
+entry = section.entry_list[0]
+field = [field for field in entry.fields if field.settings.type == "str"][0]
+other_values = [other.value for other in section.entry_list[1].fields]
+field.set_value("a" * (section.entry_size * 2))
+assert len(entry.to_bytes()) == section.entry_size
+assert len(section.to_bytes()) == section.entry_size * section.entry_amount
+new_section = Param(param.to_bytes(), settings).get_section(1)
+assert [other.value for other in new_section.entry_list[1].fields] == other_values
 
 print("Tests passed")
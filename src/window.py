@@ -30,14 +30,12 @@ class Application(QtWidgets.QMainWindow, main_window.Ui_MainWindow):
 
         # Add the enums from msg files
         directory = resource_path("res/msg/")
-        for filename in os.listdir(directory):
-            f = os.path.join(directory, filename)
-            with open(resource_path(f), "rb") as file:
-                data = file.read()
-                self.settings.add_enum_from_msg(os.path.splitext(filename)[0], data)
+        for path in directory.iterdir():
+            self.settings.add_enum_from_msg(path.stem, path.read_bytes())
 
         # Load other data
-        data = open(resource_path("res/settings.txt")).readlines()
+        with open(resource_path("res/settings.txt")) as file:
+            data = file.readlines()
         self.settings.load_enums_from_data(data)
         self.settings.load_fields_from_data(data)
 
@@ -45,6 +43,9 @@ class Application(QtWidgets.QMainWindow, main_window.Ui_MainWindow):
         self.param = Param(None, self.settings)
         self.path = None
 
+        # Form widgets detached from the field list, by widget type
+        self.widget_pool = {}
+
         # If opened via cmd with parameters
         if len(sys.argv) > 1:
             if sys.argv[1]:
@@ -112,16 +113,19 @@ class Application(QtWidgets.QMainWindow, main_window.Ui_MainWindow):
         """
         Read Param file
         """
-        with open(file, "r+b") as f:
+        # Read the whole file into memory instead of mapping it, since the
+        # param keeps views into this buffer and saving overwrites the file
+        with open(file, "rb") as f:
             data = f.read()
-            self.path = file
-            self.param.load_from_data(data)
-            self.output_path = os.path.dirname(os.path.abspath(self.path))
-            self.file_name = os.path.basename(os.path.abspath(self.path))
-            self.lb_file_name.setText(f"Filename: {self.file_name}")
-            self.refresh()
-            self.set_action_state(True)
-            self.show_message(f"Loaded file {self.path}")
+
+        self.path = file
+        self.param.load_from_data(data)
+        self.output_path = os.path.dirname(os.path.abspath(self.path))
+        self.file_name = os.path.basename(os.path.abspath(self.path))
+        self.lb_file_name.setText(f"Filename: {self.file_name}")
+        self.refresh()
+        self.set_action_state(True)
+        self.show_message(f"Loaded file {self.path}")
 
     def refresh_file(self):
         if self.path is None:
@@ -134,14 +138,22 @@ class Application(QtWidgets.QMainWindow, main_window.Ui_MainWindow):
         """
 
         # Save backup if enabled in settings
-        if self.check_backup.isChecked:
-            shutil.copy(self.path, f"{self.path}.bak")
+        if self.path and self.check_backup.isChecked():
+            shutil.copyfile(self.path, f"{self.path}.bak")
 
         # Save file
         if self.path and self.param:
-            data_to_save = self.param.to_bytes()
-            with open(self.path, "wb") as f:
-                f.write(data_to_save)
+            # Write section by section to a temporary file, so a failed save
+            # never leaves a partially written param behind
+            temp_path = f"{self.path}.tmp"
+            try:
+                with open(temp_path, "wb") as f:
+                    f.writelines(self.param.iter_bytes())
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            os.replace(temp_path, self.path)
             self.show_message(f"Saved file {self.path}")
 
     def refresh(self):
@@ -169,24 +181,44 @@ class Application(QtWidgets.QMainWindow, main_window.Ui_MainWindow):
         Loads sections
         """
         index = self.cb_sections.currentIndex()
+
+        # Fill the combo box in one go, the entries are reloaded afterwards
+        self.cb_sections.blockSignals(True)
         self.cb_sections.clear()
-        for section in self.param.section_list:
-            self.cb_sections.addItem(f"{section.id+1} ({section.entry_amount} entries)")
+        self.cb_sections.addItems(
+            [
+                f"{section.id+1} ({section.entry_amount} entries)"
+                for section in self.param.section_list
+            ]
+        )
 
-        if save_index:
+        # Keep the first section selected if there was no selection before
+        if save_index and index >= 0:
             self.cb_sections.setCurrentIndex(index)
+        self.cb_sections.blockSignals(False)
 
     def load_section_entries(self):
         """
         Loads entries
         """
-        self.cb_entries.clear()
+        entry_names = []
         for entry in self.param.get_section_entries(self.cb_sections.currentIndex()):
             entry_name = entry.get_name()
             if entry_name == "":
-                self.cb_entries.addItem(f"{entry.id}")
+                entry_names.append(f"{entry.id}")
             else:
-                self.cb_entries.addItem(f"{entry.id}: {entry_name}")
+                entry_names.append(f"{entry.id}: {entry_name}")
+
+        # Avoid loading the form for every intermediate selection
+        self.cb_entries.blockSignals(True)
+        self.cb_entries.clear()
+        self.cb_entries.addItems(entry_names)
+        self.cb_entries.blockSignals(False)
+
+        if self.cb_entries.count() > 0:
+            self.update_selected_entry()
+        else:
+            self.clear_form_items()
 
     def update_selected_entry(self):
         """
@@ -202,23 +234,23 @@ class Application(QtWidgets.QMainWindow, main_window.Ui_MainWindow):
         entry = self.param.get_section_entry(current_section, current_entry)
 
         for field in entry.fields:
-            label = QtWidgets.QLabel(field.settings.name)
+            label = self.get_form_widget(QtWidgets.QLabel, self.sc_content)
+            label.setText(field.settings.name)
             label.setToolTip(field.settings.description)
 
             if field.settings.type == "bool":
-                widget = QCheckBoxField(self.sc_content)
+                widget = self.get_form_widget(QCheckBoxField, self.sc_content)
             elif (
                 field.settings.enum
                 and field.value >= -1
                 and field.value < len(field.settings.enum.get_values()) - 1
             ):
-                widget = QComboBoxField(self.frame_controls)
+                widget = self.get_form_widget(QComboBoxField, self.frame_controls)
             elif field.settings.type == "rgba":
-                widget = QColorPickerField(self.sc_content)
+                widget = self.get_form_widget(QColorPickerField, self.sc_content)
             else:
-                widget = QLineEditField(self.sc_content)
+                widget = self.get_form_widget(QLineEditField, self.sc_content)
             widget.set_field(field)
-            widget.field_changed.connect(self.field_changed)
             self.fl_fields.addRow(label, widget)
 
         text = bytes_to_string(entry.to_bytes())
@@ -241,7 +273,29 @@ class Application(QtWidgets.QMainWindow, main_window.Ui_MainWindow):
         Clears all items in form
         """
         for i in reversed(range(self.fl_fields.count())):
-            self.fl_fields.itemAt(i).widget().setParent(None)
+            widget = self.fl_fields.itemAt(i).widget()
+            widget.setParent(None)
+
+            # Keep the widget around to be reused by the next entry
+            if not isinstance(widget, QtWidgets.QLabel):
+                widget.clear_field()
+            self.widget_pool.setdefault(type(widget), []).append(widget)
+
+    def get_form_widget(self, widget_type: type, parent: QtWidgets.QWidget):
+        """
+        Returns a form widget of the given type, reusing a pooled one if possible
+        Args:
+            widget_type (type): Widget class
+            parent (QtWidgets.QWidget): Parent used when creating a new widget
+        """
+        pool = self.widget_pool.get(widget_type)
+        if pool:
+            return pool.pop()
+
+        widget = widget_type(parent)
+        if widget_type is not QtWidgets.QLabel:
+            widget.field_changed.connect(self.field_changed)
+        return widget
 
     def get_current_entry(self):
         """
@@ -334,10 +388,11 @@ class Application(QtWidgets.QMainWindow, main_window.Ui_MainWindow):
         """
         Adds an empty section
         """
+        # Base 0 accepts both decimal and prefixed values like 0x10
         try:
-            section_size = eval(self.le_section_size.text())
-            section_entries = eval(self.le_section_entry_amount.text())
-        except Exception as _:
+            section_size = int(self.le_section_size.text(), 0)
+            section_entries = int(self.le_section_entry_amount.text(), 0)
+        except ValueError as _:
             return
 
         if section_size <= 0:
@@ -352,6 +407,7 @@ class Application(QtWidgets.QMainWindow, main_window.Ui_MainWindow):
         self.le_section_entry_amount.setText("")
 
         self.load_sections(True)
+        self.load_section_entries()
         self.show_message("Added new section")
 
     def edit_raw_data(self):